@@ -1,7 +1,17 @@
 import json
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 def load_config(config_path: str):
+    # orjson is optional; it parses large configs noticeably faster than the stdlib
+    if orjson is not None:
+        with open(config_path, 'rb') as f:
+            return orjson.loads(f.read())
+
     with open(config_path, 'r') as f:
         config = json.load(f)
     return config
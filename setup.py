@@ -8,4 +8,10 @@ setup(
     version='0.2.0',
     packages=find_packages(),
     install_requires=read_requirements(),
+    extras_require={
+        # Faster JSON parsing for configs and notebooks
+        'fast': ['orjson'],
+        # Smaller notebook HTML with the minify_notebooks option
+        'minify': ['minify-html'],
+    },
 )
\ No newline at end of file
@@ -1,15 +1,321 @@
 import os
-import glob
+import copy
+import contextlib
+import functools
+import gzip
+import hashlib
+import html
+import importlib.metadata
+import itertools
+import json
+import logging
+import logging.handlers
+import multiprocessing
+import multiprocessing.util
+import queue
 import re
-from typing import Union
+import shutil
+import sys
+import threading
+import urllib.parse
+from collections import Counter, defaultdict, deque
+from typing import Iterator, Union
 
-import nbformat
 import subprocess
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime
-from jinja2 import Template
+
+# nbformat and nbconvert are slow to import, so _nbconvert_available loads them on first use
+nbformat = None
+HTMLExporter = None
+ExecutePreprocessor = None
+run_sync = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import minify_html
+except ImportError:
+    minify_html = None
 
 from misc.config_loader import load_config
 
+# Conversion workers report progress through this logger; _make_executor prints the records
+_LOGGER = logging.getLogger("tabs_report")
+
+
+class _ConsoleFormatter(logging.Formatter):
+    """Format conversion log records as their message, marking warnings with a "Warning: " prefix."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        message = super().format(record)
+        return f"Warning: {message}" if record.levelno == logging.WARNING else message
+
+
+# nbconvert template used when the config doesn't set 'nbconvert_template'
+_DEFAULT_TEMPLATE = "basic"
+
+# `jupyter nbconvert` arguments shared by every command-line conversion; the template name follows
+_NBCONVERT_CMD = ("jupyter", "nbconvert", "--to", "html", "--no-input", "--template")
+
+# Per-process HTMLExporters keyed by template name, built lazily by _get_exporter
+_EXPORTERS = {}
+
+# Converted notebooks are cached in this subfolder of output_folder, keyed by content hash
+_CACHE_DIR_NAME = ".nbcache"
+_CACHE_ENTRIES_PER_NOTEBOOK = 3
+
+# Character maps for _notebook_names: underscores become spaces in display names,
+# path separators become underscores in output file names
+_UNDERSCORE_TO_SPACE = str.maketrans("_", " ")
+_SEPARATOR_TO_UNDERSCORE = str.maketrans({os.path.sep: "_", "/": "_", "\\": "_"})
+
+# Word separators in discovered subdirectory names, which become spaces in topic names
+_WORD_SEPARATOR_TO_SPACE = str.maketrans("_-", "  ")
+
+# Write buffer for the final report, so a multi-MB report takes a handful of write calls
+_REPORT_WRITE_BUFFER = 1024 * 1024
+
+# Records what the last report in output_folder was built from, see _up_to_date_report
+_MANIFEST_NAME = ".report_manifest.json"
+
+
+# Report stylesheets. The rules are shared between layouts, so each
+# stylesheet is assembled once at import time from the pieces below.
+
+# Page background and the white report card
+_PAGE_CSS = """        body {
+            background-color: #f8f9fa;
+        }
+
+        .container {
+            background-color: white;
+            border-radius: 0.5rem;
+            box-shadow: 0 0.125rem 0.25rem rgba(0, 0, 0, 0.075);
+            padding: 2rem;
+            margin-top: 2rem;
+            margin-bottom: 2rem;
+        }
+
+"""
+
+# Notebook content: image sizing and RTL text support
+_NOTEBOOK_CONTENT_CSS = """        /* Prevent image overflow and horizontal scrolling */
+        img {
+            max-width: 100%;
+            height: auto;
+            display: block;
+        }
+
+        /* RTL Support - Targeted approach using special class */
+        .rtl-text-content {
+            direction: rtl !important;
+            text-align: right !important;
+            display: inline !important;
+            margin: 0 !important;
+            padding: 0 !important;
+            font-size: inherit !important;
+            font-weight: inherit !important;
+            line-height: inherit !important;
+            color: inherit !important;
+        }
+        
+        /* Ensure all other elements remain LTR (images, code, etc.) */
+        img, figure, .output_png, .output_jpeg, code, pre {
+            direction: ltr !important;
+            text-align: left !important;
+        }
+        
+        /* Specific image centering */
+        .output_png img, .output_jpeg img {
+            display: block !important;
+            margin: 0 auto !important;
+        }
+
+        /* Keep table structure LTR even if cells have RTL text */
+        table {
+            direction: ltr;
+        }
+"""
+
+# Pill-style tab navigation and the bordered tab content area
+_TABS_CSS = """        .nav-pills .nav-link {
+            background-color: #f8f9fa;
+            color: #495057;
+            margin: 0 2px;
+            border-radius: 0.375rem;
+        }
+
+        .nav-pills .nav-link.active {
+            background-color: #0d6efd;
+            color: white;
+        }
+
+        .nav-pills .nav-link:hover {
+            background-color: #e9ecef;
+            color: #495057;
+        }
+
+        .nav-pills .nav-link.active:hover {
+            background-color: #0b5ed7;
+            color: white;
+        }
+
+        .tab-content {
+            background-color: white;
+            border: 1px solid #dee2e6;
+            border-radius: 0.375rem;
+            padding: 20px;
+            margin-top: 10px;
+        }
+
+"""
+
+# Spacing and font sizes for the two levels of nested tabs
+_NESTED_TABS_CONTAINER_CSS = """        .nested-tabs-container {
+            margin-top: 20px;
+        }
+
+"""
+
+_NESTED_TABS_FONT_CSS = """        .main-tabs .nav-tabs .nav-link {
+            font-weight: 500;
+            font-size: 1.1em;
+        }
+
+        .nested-tabs-container .nav-pills .nav-link {
+            font-size: 0.95em;
+        }
+
+"""
+
+# Bordered box around a single notebook
+_SINGLE_CONTENT_CSS = """        .content {
+            background-color: white;
+            border: 1px solid #dee2e6;
+            border-radius: 0.375rem;
+            padding: 20px;
+            margin-top: 10px;
+        }
+
+"""
+
+
+def _style_block(*rules: str) -> str:
+    """Wrap CSS rules in a <style> element indented for the report <head>."""
+    return "\n    <style>\n" + "".join(rules) + "    </style>\n    "
+
+
+_NESTED_CSS = _style_block(
+    _NESTED_TABS_CONTAINER_CSS, _TABS_CSS, _NESTED_TABS_FONT_CSS, _PAGE_CSS, _NOTEBOOK_CONTENT_CSS
+)
+_FLAT_CSS = _style_block(_TABS_CSS, _PAGE_CSS, _NOTEBOOK_CONTENT_CSS)
+_SINGLE_CSS = _style_block(_PAGE_CSS, _SINGLE_CONTENT_CSS, _NOTEBOOK_CONTENT_CSS)
+
+# Meta tags and Bootstrap/Bokeh CDN assets shared by the <head> of every report
+_HEAD_ASSETS = """<meta charset="UTF-8">
+        <meta name="viewport" content="width=device-width, initial-scale=1.0">
+        <link href="https://cdn.jsdelivr.net/npm/bootstrap@5.1.3/dist/css/bootstrap.min.css" rel="stylesheet">
+        <link rel="stylesheet" href="https://cdn.bokeh.org/bokeh/release/bokeh-3.3.0.min.css" type="text/css" />
+
+        <script src="https://cdn.bokeh.org/bokeh/release/bokeh-3.3.0.min.js"></script>
+        <script src="https://cdn.bokeh.org/bokeh/release/bokeh-widgets-3.3.0.min.js"></script>
+        <script src="https://cdn.bokeh.org/bokeh/release/bokeh-tables-3.3.0.min.js"></script>"""
+
+# Tab markup state, indexed by whether the tab is the active one:
+# (nav-link class, aria-selected value, tab-pane class)
+_TAB_STATES = {
+    True: ("active", "true", "show active"),
+    False: ("", "false", "")
+}
+
+# Kernels a conversion worker keeps running between the notebooks it executes when
+# reuse_kernels is on, by kernel name. _shutdown_shared_kernels stops them when the worker exits.
+_SHARED_KERNELS = {}
+
+# Run in a reused kernel before each notebook: drops the previous notebook's variables
+# and moves to the new notebook's directory. Modules already imported stay loaded.
+_KERNEL_RESET_CODE = "get_ipython().run_line_magic('reset', '-f')\n__import__('os').chdir({path!r})"
+
+# Hebrew (\u0590-\u05FF) and Arabic (\u0600-\u06FF, \u0750-\u077F, \u08A0-\u08FF) characters
+_RTL_CHARS = r'\u0590-\u05FF\u0600-\u06FF\u0750-\u077F\u08A0-\u08FF'
+_RTL_CHAR_RE = re.compile(f'[{_RTL_CHARS}]')
+
+# A run of RTL words and the whitespace between them, wrapped in one RTL paragraph.
+# Each repetition must start with whitespace, so there is only one way to match a run.
+_RTL_RUN_RE = re.compile(rf'([{_RTL_CHARS}]+(?:\s+[{_RTL_CHARS}]+)*)')
+
+# Elements whose text _apply_rtl_processing wraps, as (opening tag)(content)(closing tag),
+# each with the closing tags it can end with
+_RTL_TEXT_ELEMENT_RES = tuple((re.compile(pattern, re.DOTALL), closing_tags) for pattern, closing_tags in (
+    # Headings
+    (r'(<h[1-6][^>]*>)(.*?)(</h[1-6]>)', tuple(f'</h{level}>' for level in range(1, 7))),
+    # Paragraphs
+    (r'(<p[^>]*>)(.*?)(</p>)', ('</p>',)),
+    # List items
+    (r'(<li[^>]*>)(.*?)(</li>)', ('</li>',)),
+    # Table cells
+    (r'(<td[^>]*>)(.*?)(</td>)', ('</td>',)),
+    (r'(<th[^>]*>)(.*?)(</th>)', ('</th>',)),
+    # Pre-formatted text (common in Jupyter notebook outputs)
+    (r'(<pre[^>]*>)(.*?)(</pre>)', ('</pre>',)),
+    # Generic divs (but skip structural ones). Intentionally inert: every opening tag this
+    # matches has 'cell' in its class, so process_element_content returns it unchanged. The
+    # markdown inside is still wrapped by the element passes above.
+    (r'(<div[^>]*class="text_cell_render[^"]*"[^>]*>)(.*?)(</div>)', ('</div>',)),
+))
+
+# BokehJS files the report loads in its <head>
+_HEAD_BOKEH_URLS = tuple(re.findall(r'https://cdn\.bokeh\.org/[^"]+', _HEAD_ASSETS))
+
+# <script>/<link> tags in a notebook that load one of _HEAD_BOKEH_URLS. They are left out of
+# the notebook's embedded copy rather than loaded again for each notebook. Tags loading other
+# Bokeh versions or bundles stay. Quotes are optional, as minify-html may drop them.
+_BOKEH_CDN_URLS = '|'.join(map(re.escape, _HEAD_BOKEH_URLS))
+_BOKEH_CDN_TAG_RE = re.compile(
+    (rf'<script\b[^>]*\bsrc=["\']?(?:{_BOKEH_CDN_URLS})(?=["\'\s>])["\']?[^>]*>\s*</script>\s*'
+     rf'|<link\b[^>]*\bhref=["\']?(?:{_BOKEH_CDN_URLS})(?=["\'\s>])["\']?[^>]*>\s*').encode('utf-8'),
+    re.IGNORECASE
+)
+
+# Notebook bodies read in the background ahead of the one being written to the report
+_READ_AHEAD = 4
+
+# Fills each .nb-ref placeholder with the notebook body stored in the <template> it names
+_SHARED_BODY_SCRIPT = """<script>
+        document.querySelectorAll('.nb-ref').forEach(function (ref) {
+            var body = document.getElementById(ref.dataset.nb).content;
+            ref.replaceWith(document.importNode(body, true));
+        });
+    </script>
+    """
+
+# Loads a lazily loaded tab pane's notebook from its data-src the first time the pane is shown.
+# createContextualFragment is used instead of innerHTML so the notebook's output scripts run.
+_LAZY_LOAD_SCRIPT = """<script>
+        function loadShownNotebooks() {
+            document.querySelectorAll('.tab-pane.active[data-src]:not([data-loaded])').forEach(function (pane) {
+                if (pane.parentElement.closest('.tab-pane:not(.active)')) {
+                    return;
+                }
+                pane.dataset.loaded = 'true';
+                fetch(pane.dataset.src)
+                    .then(function (response) { return response.text(); })
+                    .then(function (html) {
+                        pane.replaceChildren(document.createRange().createContextualFragment(html));
+                    })
+                    .catch(function () {
+                        pane.textContent = 'Could not load ' + pane.dataset.src;
+                    });
+            });
+        }
+        document.addEventListener('shown.bs.tab', loadShownNotebooks);
+        loadShownNotebooks();
+    </script>
+    """
 
 
 def _has_rtl_content(text: str) -> bool:
@@ -30,10 +336,10 @@ def _has_rtl_content(text: str) -> bool:
         - Hebrew: \\u0590-\\u05FF
         - Arabic: \\u0600-\\u06FF, \\u0750-\\u077F, \\u08A0-\\u08FF
     """
-    # Hebrew Unicode range: \u0590-\u05FF
-    # Arabic Unicode range: \u0600-\u06FF, \u0750-\u077F, \u08A0-\u08FF
-    rtl_pattern = r'[\u0590-\u05FF\u0600-\u06FF\u0750-\u077F\u08A0-\u08FF]'
-    return bool(re.search(rtl_pattern, text))
+    # CPython records whether a str is pure ASCII, so this skips the scan for most text
+    if text.isascii():
+        return False
+    return bool(_RTL_CHAR_RE.search(text))
 
 
 def _apply_rtl_processing(html_content: str) -> str:
@@ -74,27 +380,21 @@ def _apply_rtl_processing(html_content: str) -> str:
     if not _has_rtl_content(html_content):
         return html_content
     
-    # Function to check if a specific text snippet contains RTL characters
-    def has_rtl_in_text(text):
-        rtl_pattern = r'[\u0590-\u05FF\u0600-\u06FF\u0750-\u077F\u08A0-\u08FF]'
-        return bool(re.search(rtl_pattern, text))
-    
     # Function to wrap RTL content in special paragraph
     def wrap_rtl_content(text):
-        if not has_rtl_in_text(text):
+        # ASCII text can't hold RTL runs; otherwise one substitution pass both
+        # finds and wraps them, and returns text with none unchanged
+        if text.isascii():
             return text
         
         # Split text into RTL and non-RTL segments
         # Match sequences that contain RTL characters, but only capture RTL parts
-        rtl_pattern = r'([\u0590-\u05FF\u0600-\u06FF\u0750-\u077F\u08A0-\u08FF]+(?:\s*[\u0590-\u05FF\u0600-\u06FF\u0750-\u077F\u08A0-\u08FF]+)*)'
-        
         def replace_rtl_segment(match):
             rtl_text = match.group(1)
             return f'<p class="rtl-text-content" dir="rtl">{rtl_text}</p>'
         
         # Replace RTL segments with wrapped paragraphs
-        processed_text = re.sub(rtl_pattern, replace_rtl_segment, text)
-        return processed_text
+        return _RTL_RUN_RE.sub(replace_rtl_segment, text)
     
     # Process text content in various HTML elements
     def process_element_content(match):
@@ -104,7 +404,8 @@ def _apply_rtl_processing(html_content: str) -> str:
         closing_tag = match.group(3) if len(match.groups()) >= 3 else ""
         
         # Skip if already has dir attribute or is structural element
-        if 'dir=' in opening_tag or any(cls in opening_tag for cls in ['output', 'cell', 'jp-']):
+        # (nbconvert's structural classes first, as they are the most common)
+        if 'jp-' in opening_tag or 'cell' in opening_tag or 'output' in opening_tag or 'dir=' in opening_tag:
             return full_tag
         
         # Process content for RTL wrapping
@@ -112,36 +413,708 @@ def _apply_rtl_processing(html_content: str) -> str:
         
         return opening_tag + processed_content + closing_tag
     
-    # Target various text-containing elements
-    text_patterns = [
-        # Headings
-        (r'(<h[1-6][^>]*>)(.*?)(</h[1-6]>)', process_element_content),
-        # Paragraphs  
-        (r'(<p[^>]*>)(.*?)(</p>)', process_element_content),
-        # List items
-        (r'(<li[^>]*>)(.*?)(</li>)', process_element_content),
-        # Table cells
-        (r'(<td[^>]*>)(.*?)(</td>)', process_element_content),
-        (r'(<th[^>]*>)(.*?)(</th>)', process_element_content),
-        # Pre-formatted text (common in Jupyter notebook outputs)
-        (r'(<pre[^>]*>)(.*?)(</pre>)', process_element_content),
-        # Generic divs (but skip structural ones)
-        (r'(<div[^>]*class="text_cell_render[^"]*"[^>]*>)(.*?)(</div>)', process_element_content),
-    ]
-    
-    # Apply RTL processing
-    for pattern, processor in text_patterns:
-        html_content = re.sub(pattern, processor, html_content, flags=re.DOTALL)
+    # Apply RTL processing to each kind of text element in turn
+    for pattern, closing_tags in _RTL_TEXT_ELEMENT_RES:
+        # Every match ends at a closing tag, so nothing after the last one can match.
+        # Leaving that tail out of the scan matters: each opening tag there (e.g. the
+        # <path> elements of an SVG plot for the <p> pattern) would otherwise be
+        # scanned to the end of the document, which is quadratic in its length.
+        end = max(html_content.rfind(closing_tag) for closing_tag in closing_tags)
+        if end < 0:
+            continue
+        end += len(closing_tags[0])
+        html_content = pattern.sub(process_element_content, html_content[:end]) + html_content[end:]
     
     return html_content
 
 
+@functools.lru_cache(maxsize=None)
+def _nbconvert_available() -> bool:
+    """
+    Import nbformat and nbconvert the first time they are needed.
+
+    Returns:
+        bool: False if nbconvert can't be imported, in which case notebooks are
+            converted with the `jupyter nbconvert` command (see _convert_with_cli).
+    """
+    global nbformat, HTMLExporter, ExecutePreprocessor, run_sync
+    try:
+        import nbformat as nbformat_module
+        from nbclient.util import run_sync as run_sync_function
+        from nbconvert import HTMLExporter as html_exporter_class
+        from nbconvert.preprocessors import ExecutePreprocessor as execute_preprocessor_class
+    except ImportError:
+        return False
+
+    nbformat = nbformat_module
+    HTMLExporter = html_exporter_class
+    ExecutePreprocessor = execute_preprocessor_class
+    run_sync = run_sync_function
+    return True
+
+
+def _get_exporter(template: str = _DEFAULT_TEMPLATE) -> "HTMLExporter":
+    """
+    Return this process's HTMLExporter for a template, creating it on first use.
+
+    The exporter compiles its Jinja templates when it is built, so one instance
+    per template is kept per process and reused for every notebook converted
+    there. Options match `jupyter nbconvert --to html --no-input --template {template}`.
+    """
+    exporter = _EXPORTERS.get(template)
+    if exporter is None:
+        exporter = _EXPORTERS[template] = HTMLExporter(
+            template_name=template,
+            exclude_input=True,
+            exclude_input_prompt=True,
+            exclude_output_prompt=True
+        )
+    return exporter
+
+
+def _read_notebook(notebook_file: str) -> "nbformat.NotebookNode":
+    """
+    Read a notebook as nbformat v4, like nbformat.read.
+
+    When orjson is installed it parses v4 notebooks, which is much faster
+    than the stdlib parser on notebooks with large embedded image outputs,
+    and nbformat.v4.to_notebook turns the parsed dict into a NotebookNode.
+    That skips nbformat's upgrades, so only notebooks already at this
+    nbformat's v4 minor version take that path. Other versions, and files
+    orjson rejects (e.g. outputs containing NaN or Infinity, which the
+    stdlib json module accepts), are read with nbformat.reads.
+    """
+    if orjson is None:
+        return nbformat.read(notebook_file, as_version=4)
+
+    with open(notebook_file, 'rb') as f:
+        data = f.read()
+    try:
+        nb_dict = orjson.loads(data)
+    except orjson.JSONDecodeError:
+        nb_dict = None
+    if (
+        not isinstance(nb_dict, dict)
+        or nb_dict.get('nbformat') != 4
+        or nb_dict.get('nbformat_minor') != nbformat.v4.nbformat_minor
+    ):
+        return nbformat.reads(data.decode('utf-8'), as_version=4)
+
+    nb = nbformat.v4.to_notebook(nb_dict)
+    try:
+        nbformat.validate(nb)
+    except nbformat.ValidationError as e:
+        _LOGGER.warning("Notebook JSON is invalid in %s: %s", notebook_file, e)
+    return nb
+
+
+def _shutdown_kernel(km: "KernelManager") -> None:
+    """Shut down a kernel started by _execute_notebook, ignoring one that is already gone."""
+    try:
+        run_sync(km.shutdown_kernel)(now=True)
+    except Exception as e:
+        _LOGGER.warning("Could not shut down kernel: %s", e)
+
+
+def _shutdown_shared_kernels() -> None:
+    """Shut down the kernels this process kept running for reuse_kernels."""
+    while _SHARED_KERNELS:
+        _, km = _SHARED_KERNELS.popitem()
+        _shutdown_kernel(km)
+
+
+def _execute_notebook(nb: "nbformat.NotebookNode", resources: dict, reuse_kernel: bool = False) -> None:
+    """
+    Execute a notebook in place with nbconvert's ExecutePreprocessor.
+
+    By default every notebook gets a fresh kernel. With reuse_kernel, Python
+    notebooks run in a kernel this process keeps for their kernel name, so
+    kernel startup and the notebooks' common imports are paid once per worker
+    instead of once per notebook. Before each notebook the kernel's variables
+    are cleared and its working directory is set to the notebook's, but
+    imported modules and their state carry over between notebooks.
+
+    Args:
+        nb (nbformat.NotebookNode): Notebook to execute. Outputs are filled in place.
+        resources (dict): nbconvert resources; metadata.path is the notebook's directory.
+        reuse_kernel (bool, optional): Run in a kernel shared with the other
+            notebooks this process executes. Defaults to False.
+
+    Raises:
+        Exception: Whatever the preprocessor raised. A shared kernel is shut
+            down first, so the next notebook starts a new one.
+    """
+    kernelspec = nb.metadata.get('kernelspec', {})
+    if not reuse_kernel or kernelspec.get('language', 'python') != 'python':
+        ExecutePreprocessor(timeout=600).preprocess(nb, resources)
+        return
+
+    kernel_name = kernelspec.get('name', '')
+    notebook_dir = os.path.abspath(resources['metadata']['path'])
+
+    async def reset_kernel(notebook):
+        msg_id = executor.kc.execute(_KERNEL_RESET_CODE.format(path=notebook_dir), silent=True, store_history=False)
+        reply = await executor.async_wait_for_reply(msg_id)
+        if reply['content']['status'] != 'ok':
+            raise RuntimeError(f"Could not reset the shared kernel: {reply['content'].get('evalue')}")
+
+    executor = ExecutePreprocessor(timeout=600, kernel_name=kernel_name, on_notebook_start=reset_kernel)
+    km = _SHARED_KERNELS.get(kernel_name)
+    if km is None:
+        if not _SHARED_KERNELS:
+            multiprocessing.util.Finalize(None, _shutdown_shared_kernels, exitpriority=10)
+        km = _SHARED_KERNELS[kernel_name] = executor.create_kernel_manager()
+
+    # The preprocessor leaves a kernel it doesn't own running, but its client still needs closing
+    try:
+        executor.preprocess(nb, resources, km=km)
+    except Exception:
+        # A failed run can leave the kernel busy or dead, so don't hand it to the next notebook
+        del _SHARED_KERNELS[kernel_name]
+        _shutdown_kernel(km)
+        raise
+    finally:
+        if executor.kc is not None:
+            executor.kc.stop_channels()
+
+
+def _convert_in_process(
+    notebook_file: str,
+    html_output_path: str,
+    execute: bool = False,
+    template: str = _DEFAULT_TEMPLATE,
+    reuse_kernel: bool = False
+) -> bool:
+    """
+    Convert a notebook to HTML with the nbconvert Python API.
+
+    Execution runs on a copy of the parsed notebook. If it fails, the
+    untouched original is converted without execution, the same fallback the
+    command-line path uses, without reading the file a second time.
+
+    With reuse_kernel, the notebook is executed in a kernel shared with the
+    other notebooks this process converts (see _execute_notebook).
+
+    Returns:
+        bool: False if execution was requested but failed, True otherwise.
+    """
+    resources = {
+        'metadata': {
+            'name': os.path.splitext(os.path.basename(notebook_file))[0],
+            'path': os.path.dirname(notebook_file)
+        }
+    }
+    nb = _read_notebook(notebook_file)
+    complete = True
+
+    if execute:
+        # The preprocessor fills in outputs in place, so a failed run would leave nb half-executed
+        executed_nb = copy.deepcopy(nb)
+        try:
+            _execute_notebook(executed_nb, resources, reuse_kernel)
+            nb = executed_nb
+        except Exception as e:
+            _LOGGER.warning(
+                "Error executing notebook %s. Converting without execution.\nError details: %s", notebook_file, e
+            )
+            _LOGGER.info("Retrying conversion without execution...")
+            complete = False
+
+    body, _ = _get_exporter(template).from_notebook_node(nb, resources)
+    # Replace rather than overwrite, since the old file may be hard-linked to a cache entry
+    tmp_path = _tmp_path_for(html_output_path)
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        f.write(body)
+    os.replace(tmp_path, html_output_path)
+
+    return complete
+
+
+def _convert_with_cli(
+    notebook_file: str,
+    html_output_path: str,
+    execute: bool = False,
+    template: str = _DEFAULT_TEMPLATE
+) -> bool:
+    """
+    Convert a notebook to HTML by running the `jupyter nbconvert` command.
+
+    Used when nbconvert cannot be imported in this interpreter, e.g. when
+    Jupyter is installed in a separate environment.
+
+    Returns:
+        bool: False if the first nbconvert run failed, True otherwise.
+    """
+    # Build nbconvert command, adding the execute flag if enabled
+    output_args = ("--output", html_output_path, notebook_file)
+    execute_args = ("--execute",) if execute else ()
+    nbconvert_cmd = (*_NBCONVERT_CMD, template, *execute_args, *output_args)
+
+    # nbconvert overwrites in place, so unlink any hard link to a cache entry first
+    with contextlib.suppress(FileNotFoundError):
+        os.remove(html_output_path)
+
+    # Only stderr is reported on failure, so stdout isn't piped back at all
+    result = subprocess.run(nbconvert_cmd, check=False, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True)
+
+    if result.returncode != 0:
+        _LOGGER.warning(
+            "Error executing notebook %s. Converting without execution.\nError details: %s",
+            notebook_file, result.stderr
+        )
+
+        # If execution fails, try again without execution
+        if execute:
+            # Same command without the --execute flag
+            basic_cmd = (*_NBCONVERT_CMD, template, *output_args)
+            _LOGGER.info("Retrying conversion without execution...")
+            subprocess.run(basic_cmd, check=True)
+        return False
+
+    return True
+
+
+def _cache_key(
+    notebook_file: str,
+    execute: bool = False,
+    template: str = _DEFAULT_TEMPLATE,
+    minify: bool = False
+) -> str:
+    """
+    Hash a notebook's content together with the options that affect its HTML.
+
+    Two conversions with the same key produce the same output, so the key
+    names the cache entry for that conversion.
+    """
+    key = hashlib.sha256()
+    with open(notebook_file, 'rb') as f:
+        key.update(f.read())
+    key.update(f"template={template};no-input;rtl;execute={execute}".encode('utf-8'))
+    if minify:
+        key.update(b";minify")
+    return key.hexdigest()
+
+
+def _finish_conversion(html_output_path: str, minify: bool = False) -> None:
+    """
+    Prepare a freshly converted notebook for embedding, before it is cached.
+
+    RTL processing is applied, so it runs once per conversion in the worker
+    instead of every time the notebook is embedded. With minify, the HTML is
+    then minified with minify-html; closing tags are kept, so the processed
+    markup stays as RTL processing wrote it, and scripts in the notebook's
+    outputs are left as they are. The file is only rewritten if either step
+    changed it.
+    """
+    with open(html_output_path, 'r', encoding='utf-8') as f:
+        html_content = f.read()
+
+    finished = _apply_rtl_processing(html_content)
+    if minify:
+        finished = minify_html.minify(
+            finished,
+            keep_closing_tags=True,
+            keep_html_and_head_opening_tags=True,
+            minify_css=True
+        )
+    if finished == html_content:
+        return
+
+    tmp_path = _tmp_path_for(html_output_path)
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        f.write(finished)
+    os.replace(tmp_path, html_output_path)
+
+
+def _tmp_path_for(path: str) -> str:
+    """Temporary file name next to path, unique to this process and thread."""
+    return f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+
+
+def _publish(src_path: str, dest_path: str) -> None:
+    """
+    Atomically put the content of src_path at dest_path.
+
+    dest_path is hard-linked to src_path, which takes the same time for any
+    file size, and copied instead where hard links aren't supported (e.g. a
+    cache on another file system; shutil.copyfile then copies in the kernel
+    where it can). Neither file may be written in place afterwards: cache
+    entries and converted outputs are only ever replaced.
+    """
+    # Already in place. Renaming a second link to the same file over it would
+    # do nothing and leave the temporary link behind.
+    with contextlib.suppress(FileNotFoundError):
+        if os.path.samefile(src_path, dest_path):
+            return
+
+    tmp_path = _tmp_path_for(dest_path)
+    with contextlib.suppress(FileNotFoundError):
+        os.remove(tmp_path)
+    try:
+        try:
+            os.link(src_path, tmp_path)
+        except OSError:
+            shutil.copyfile(src_path, tmp_path)
+        os.replace(tmp_path, dest_path)
+    except OSError:
+        # Don't leave a partial copy or a stray link behind
+        with contextlib.suppress(OSError):
+            os.remove(tmp_path)
+        raise
+
+
+def _store_in_cache(html_output_path: str, cache_path: str, unique_name: str) -> None:
+    """
+    Add a converted notebook to the cache, replacing the entry atomically, and prune old entries.
+
+    The cache is best-effort: a failure (e.g. a full disk or a read-only
+    cache folder) is logged, and the conversion is used without caching it.
+    """
+    try:
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        _publish(html_output_path, cache_path)
+        _prune_cache(os.path.dirname(cache_path), unique_name)
+    except OSError as e:
+        _LOGGER.warning("Could not update the conversion cache for %s: %s", html_output_path, e)
+
+
+def _restore_from_cache(cache_path: str, html_output_path: str) -> bool:
+    """
+    Put a cached conversion at html_output_path, if the cache has one.
+
+    Returns:
+        bool: False if there is no usable entry, e.g. it doesn't exist, was
+            pruned concurrently or can't be read; the notebook should then be
+            converted instead.
+    """
+    try:
+        _publish(cache_path, html_output_path)
+    except FileNotFoundError:
+        return False
+    except OSError as e:
+        _LOGGER.warning("Could not use the cached conversion %s: %s", cache_path, e)
+        return False
+
+    # Mark the entry as recently used so pruning keeps it
+    try:
+        os.utime(cache_path)
+    except OSError as e:
+        _LOGGER.warning("Could not mark the cached conversion %s as used: %s", cache_path, e)
+    return True
+
+
+def _prune_cache(cache_dir: str, unique_name: str) -> None:
+    """Delete all but the most recently used cache entries for one notebook."""
+    # Entries are named {unique_name}.{sha256 hex}.html
+    entry_prefix = f"{unique_name}."
+    entry_name_length = len(entry_prefix) + 64 + len(".html")
+    with os.scandir(cache_dir) as dir_entries:
+        entries = [
+            entry for entry in dir_entries
+            if len(entry.name) == entry_name_length
+            and entry.name.startswith(entry_prefix)
+            and entry.name.endswith(".html")
+        ]
+    entries.sort(key=lambda entry: entry.stat().st_mtime, reverse=True)
+    for stale_entry in entries[_CACHE_ENTRIES_PER_NOTEBOOK:]:
+        with contextlib.suppress(FileNotFoundError):
+            os.remove(stale_entry.path)
+
+
+@functools.lru_cache(maxsize=None)
+def _notebook_names(notebook_file: str) -> tuple[str, str]:
+    """
+    Derive the default display name and the unique output name of a notebook.
+
+    Both are pure functions of the path, so they are computed once per path
+    even when the same notebook is listed under several topics.
+
+    Returns:
+        tuple[str, str]: (notebook_name, unique_name), e.g. for
+            'reports/sales_q1.ipynb': ('Sales q1', 'reports_Sales q1').
+    """
+    # Create unique name that includes directory path to avoid collisions
+    notebook_name = os.path.splitext(os.path.basename(notebook_file))[0].translate(_UNDERSCORE_TO_SPACE).capitalize()
+    notebook_dir = os.path.dirname(notebook_file)
+
+    # Create a unique identifier by including parent directory names
+    if notebook_dir and notebook_dir != '.':
+        # Replace path separators with underscores to create valid filename
+        dir_part = notebook_dir.translate(_SEPARATOR_TO_UNDERSCORE)
+        unique_name = f"{dir_part}_{notebook_name}"
+    else:
+        unique_name = notebook_name
+
+    return notebook_name, unique_name
+
+
+def _convert_one(
+    notebook_file: str,
+    output_folder: str,
+    postfix: str,
+    execute: bool = False,
+    template: str = _DEFAULT_TEMPLATE,
+    reuse_kernel: bool = False,
+    minify: bool = False,
+    use_cache: bool = True
+) -> Union[dict, None]:
+    """
+    Convert a single Jupyter notebook to HTML format using nbconvert.
+
+    This is the unit of work scheduled by convert_notebooks_to_html. Each call
+    is independent of the others, so several notebooks can be converted at the
+    same time.
+
+    Args:
+        notebook_file (str): Path to the notebook to convert.
+        output_folder (str): Absolute path of the directory where the HTML
+            file will be saved.
+        postfix (str): String appended to the output filename for uniqueness.
+        execute (bool, optional): Whether to execute the notebook before
+            conversion. Defaults to False.
+        template (str, optional): nbconvert HTML template. Defaults to "basic".
+        reuse_kernel (bool, optional): Execute in a kernel shared with the
+            other notebooks this worker converts. Defaults to False.
+        minify (bool, optional): Minify the HTML with minify-html after
+            conversion. Defaults to False.
+        use_cache (bool, optional): Take the HTML from the conversion cache
+            when the notebook is unchanged. When False the notebook is always
+            converted, and the cache entry is refreshed. Defaults to True.
+
+    Returns:
+        Union[dict, None]: Dictionary with 'output_name' (full path to the
+            generated HTML file), 'notebook_name' (default display name) and
+            'complete' (False if execution failed and the notebook was
+            converted without it), or None if the conversion failed.
+    """
+    notebook_name, unique_name = _notebook_names(notebook_file)
+    html_output_path = os.path.join(output_folder, f"{unique_name}_{postfix}.html")
+
+    # Run nbconvert with error handling, reusing a cached conversion when the notebook is unchanged
+    try:
+        cache_dir = os.path.join(output_folder, _CACHE_DIR_NAME)
+        cache_key = _cache_key(notebook_file, execute, template, minify)
+        cache_path = os.path.join(cache_dir, f"{unique_name}.{cache_key}.html")
+
+        complete = True
+        if use_cache and _restore_from_cache(cache_path, html_output_path):
+            _LOGGER.info("Using cached HTML for notebook: %s", notebook_file)
+        else:
+            _LOGGER.info("Converting notebook: %s", notebook_file)
+            if not _nbconvert_available():
+                complete = _convert_with_cli(notebook_file, html_output_path, execute, template)
+            else:
+                complete = _convert_in_process(notebook_file, html_output_path, execute, template, reuse_kernel)
+            _finish_conversion(html_output_path, minify)
+
+            # Don't cache a fallback conversion, so execution is retried next time
+            if complete:
+                _store_in_cache(html_output_path, cache_path, unique_name)
+    except Exception as e:
+        _LOGGER.error("Error converting notebook %s: %s", notebook_file, e)
+        return None
+
+    return {
+        'output_name': html_output_path,
+        'notebook_name': notebook_name,
+        'complete': complete
+    }
+
+
+def _max_workers(task_count: int, max_workers: Union[int, None] = None) -> int:
+    """Number of conversions to run at once: one per notebook, capped at max_workers (default: the CPU count)."""
+    return max(1, min(task_count, max_workers or os.cpu_count() or 1))
+
+
+def _log_to_queue(log_queue: Union[queue.SimpleQueue, "multiprocessing.Queue"]) -> None:
+    """Send this process's conversion log records to log_queue instead of printing them."""
+    _LOGGER.handlers[:] = [logging.handlers.QueueHandler(log_queue)]
+    _LOGGER.setLevel(logging.INFO)
+    _LOGGER.propagate = False
+
+
+def _init_worker(log_queue: "multiprocessing.Queue", template: str) -> None:
+    """
+    Prepare a conversion worker process: route its logs and build its exporter.
+
+    Forked workers inherit both from the parent, so this only does real work
+    where workers are spawned, and then before the first notebook is queued
+    rather than while it is being converted.
+    """
+    _log_to_queue(log_queue)
+    _nbconvert_available()
+    _get_exporter(template)
+
+
+@contextlib.contextmanager
+def _make_executor(
+    task_count: int,
+    template: str = _DEFAULT_TEMPLATE,
+    max_workers: Union[int, None] = None
+) -> Iterator[Executor]:
+    """
+    Create the pool that runs _convert_one for task_count notebooks.
+
+    In-process conversion is Python work that holds the GIL, so it gets a
+    process pool where each worker keeps its own exporter. The command-line
+    fallback only waits on subprocesses, so threads are enough there.
+
+    nbconvert is imported and the exporter for template is built here, before
+    the workers start. On Linux the workers are forked, so they inherit the
+    compiled exporter instead of each building their own. They are all forked
+    before the log listener thread starts, since forking a process that runs
+    other threads can deadlock on locks those threads hold. Elsewhere (e.g.
+    macOS, where fork is unsafe with the system frameworks) workers are
+    spawned and _init_worker builds the exporter once per worker.
+
+    Workers log through _LOGGER into a shared queue, and a single listener
+    thread here prints the records to stdout as they arrive, so messages
+    from concurrent conversions come out whole and in one place.
+
+    Yields:
+        Executor: The pool. It is shut down, and every queued log record
+            printed, when the with block exits.
+    """
+    use_processes = _nbconvert_available()
+    if use_processes:
+        _get_exporter(template)
+        start_method = "fork" if sys.platform.startswith("linux") else None
+        mp_context = multiprocessing.get_context(start_method)
+        log_queue = mp_context.Queue()
+    else:
+        log_queue = queue.SimpleQueue()
+    console_handler = logging.StreamHandler(sys.stdout)
+    console_handler.setFormatter(_ConsoleFormatter())
+    listener = logging.handlers.QueueListener(log_queue, console_handler)
+
+    previous_logging = (_LOGGER.handlers[:], _LOGGER.level, _LOGGER.propagate)
+    _log_to_queue(log_queue)
+    listener_started = False
+    try:
+        if use_processes:
+            executor = ProcessPoolExecutor(
+                max_workers=_max_workers(task_count, max_workers),
+                mp_context=mp_context,
+                initializer=_init_worker,
+                initargs=(log_queue, template)
+            )
+        else:
+            executor = ThreadPoolExecutor(max_workers=_max_workers(task_count, max_workers))
+        with executor:
+            if use_processes:
+                # The first task starts the pool; with fork, every worker is forked right
+                # then, before the pool's own thread and the listener thread exist
+                executor.submit(int)
+            listener.start()
+            listener_started = True
+            yield executor
+    finally:
+        if listener_started:
+            listener.stop()
+        _LOGGER.handlers[:], level, _LOGGER.propagate = previous_logging
+        _LOGGER.setLevel(level)
+
+
+def _submit_conversions(
+    executor: Executor,
+    notebook_files: list[str],
+    output_folder: str,
+    postfix: str,
+    execute: bool = False,
+    template: str = _DEFAULT_TEMPLATE,
+    reuse_kernel: bool = False,
+    minify: bool = False,
+    use_cache: bool = True,
+    submitted: Union[dict, None] = None
+) -> list[tuple[str, Future]]:
+    """
+    Schedule one _convert_one call per notebook and return (notebook, future) pairs in input order.
+
+    Notebooks that don't exist are left out with a single warning instead of
+    being handed to a worker only to fail there. Like other failed
+    conversions, they are simply missing from the report.
+
+    A notebook listed more than once is converted once, and every occurrence
+    gets the same future. Converting it again would repeat the work (and the
+    execution) and race on the same output file and cache entry.
+
+    Args:
+        submitted (Union[dict, None], optional): Futures already scheduled,
+            keyed by notebook path and options. Pass the same dict for every
+            batch submitted to one executor (e.g. each topic of a nested
+            report) to share conversions between batches. Updated in place.
+            Defaults to None, which only shares them within this batch.
+    """
+    existing_files = []
+    missing_files = []
+    for notebook_file in notebook_files:
+        (existing_files if os.path.isfile(notebook_file) else missing_files).append(notebook_file)
+    if missing_files:
+        _LOGGER.warning("Skipping notebooks that don't exist: %s", ', '.join(missing_files))
+
+    # Resolve the folder once here rather than once per notebook in _convert_one
+    output_folder = os.path.abspath(output_folder)
+    if submitted is None:
+        submitted = {}
+    futures = []
+    for notebook_file in existing_files:
+        submission_key = (notebook_file, output_folder, postfix, execute, template, reuse_kernel, minify, use_cache)
+        future = submitted.get(submission_key)
+        if future is None:
+            future = submitted[submission_key] = executor.submit(
+                _convert_one, notebook_file, output_folder, postfix, execute, template, reuse_kernel, minify,
+                use_cache
+            )
+        futures.append((notebook_file, future))
+    return futures
+
+
+def _collect_conversions(
+    futures: list[tuple[str, Future]],
+    custom_names: Union[list[str], None] = None
+) -> list[dict]:
+    """
+    Wait for scheduled conversions and build the result list in input order.
+
+    Failed conversions are dropped, including ones whose worker died (e.g.
+    killed for running out of memory), so one notebook can't abort the
+    report. Custom names are matched by index against the successfully
+    converted notebooks. Each entry is a copy, as a future can be shared by
+    several occurrences of the same notebook.
+    """
+    converted_html_files = []
+
+    for notebook_file, future in futures:
+        try:
+            html_file_info = future.result()
+        except Exception as e:
+            _LOGGER.error("Error converting notebook %s: %r", notebook_file, e)
+            html_file_info = None
+        if html_file_info is None:
+            # Conversion failed, continue with next notebook
+            continue
+        html_file_info = dict(html_file_info)
+
+        # Use custom name if provided, otherwise keep the default
+        if custom_names and len(custom_names) > len(converted_html_files):
+            html_file_info['notebook_name'] = custom_names[len(converted_html_files)]
+
+        converted_html_files.append(html_file_info)
+
+    return converted_html_files
+
+
 def convert_notebooks_to_html(
     notebook_files: Union[list[str], dict],
     output_folder: str,
     postfix: str,
     execute: bool = False,
-    custom_names: Union[list[str], None] = None
+    custom_names: Union[list[str], None] = None,
+    template: str = _DEFAULT_TEMPLATE,
+    max_workers: Union[int, None] = None,
+    reuse_kernels: bool = False,
+    minify: bool = False,
+    use_cache: bool = True
 ) -> list[dict]:
     """
     Convert Jupyter notebooks to HTML format using nbconvert.
@@ -149,7 +1122,9 @@ def convert_notebooks_to_html(
     This function processes a collection of Jupyter notebook files and converts
     them to HTML format suitable for inclusion in tabbed reports. It handles
     unique naming to avoid file collisions and supports optional execution
-    before conversion.
+    before conversion. Notebooks are converted concurrently, by default up to
+    the number of available CPUs, with the nbconvert Python API (or the `jupyter nbconvert`
+    command when nbconvert cannot be imported).
 
     Args:
         notebook_files (Union[list[str], dict]):
@@ -174,11 +1149,40 @@ def convert_notebooks_to_html(
             names are matched by index position. Missing indices use
             default naming. Defaults to None.
 
+        template (str, optional):
+            nbconvert HTML template used for each notebook. Defaults to
+            "basic", which leaves out the JupyterLab page chrome and CSS so
+            every embedded notebook stays small. Use "lab" to keep the full
+            JupyterLab styling.
+
+        max_workers (Union[int, None], optional):
+            Maximum number of notebooks converted at the same time.
+            Defaults to None, which uses the number of CPUs.
+
+        reuse_kernels (bool, optional):
+            With execute, run the Python notebooks each worker converts in
+            one kernel instead of starting a kernel per notebook. Variables
+            are cleared between notebooks but imported modules stay loaded.
+            Defaults to False.
+
+        minify (bool, optional):
+            Minify each converted notebook with minify-html (CSS included)
+            before it is cached and embedded. Requires the minify-html
+            package. Defaults to False.
+
+        use_cache (bool, optional):
+            Take unchanged notebooks from the conversion cache instead of
+            converting them again. When False every notebook is converted
+            (and executed) and its cache entry is refreshed. Defaults to True.
+
     Returns:
-        list[dict]: List of dictionaries containing conversion results.
+        list[dict]: List of dictionaries containing conversion results,
+            in the same order as notebook_files.
             Each dictionary has:
             - 'output_name' (str): Full path to generated HTML file
             - 'notebook_name' (str): Display name for the notebook
+            - 'complete' (bool): False if execution failed and the notebook
+              was converted without it
 
     Raises:
         subprocess.CalledProcessError: If nbconvert fails critically
@@ -191,82 +1195,193 @@ def convert_notebooks_to_html(
         - Handles path collisions by including parent directory names
         - Replaces spaces and special characters for web compatibility
 
+    Caching:
+        - Converted HTML is cached in {output_folder}/.nbcache
+        - Entries are keyed by a SHA-256 of the notebook content and options
+        - Unchanged notebooks are linked from the cache instead of converted,
+          unless use_cache is False
+        - Conversions that fell back to no execution are not cached
+        - The 3 most recently used entries per notebook are kept
+        - Cache errors (e.g. a full disk) are logged; the notebook is then
+          converted and used without the cache
+
     Execution Behavior:
-        - Uses jupyter nbconvert with --execute flag when enabled
+        - Runs nbconvert's ExecutePreprocessor when enabled
         - Applies 600-second timeout per cell
-        - Continues on cell errors with --allow-errors
-        - Falls back to non-execution if execution fails entirely
+        - Stops at the first cell error: the notebook is then converted
+          without execution, and is not cached so execution is retried
         - Provides detailed error logging for troubleshooting
     """
+    notebook_files = list(notebook_files)
     os.makedirs(output_folder, exist_ok=True)
-    converted_html_files = []
 
-    for notebook_file in notebook_files:
-        # Create unique name that includes directory path to avoid collisions
-        notebook_name = os.path.splitext(os.path.basename(notebook_file))[0].replace("_", " ").capitalize()
-        notebook_dir = os.path.dirname(notebook_file)
-        
-        # Create a unique identifier by including parent directory names
-        if notebook_dir and notebook_dir != '.':
-            # Replace path separators with underscores to create valid filename
-            dir_part = notebook_dir.replace(os.path.sep, '_').replace('/', '_').replace('\\', '_')
-            unique_name = f"{dir_part}_{notebook_name}"
-        else:
-            unique_name = notebook_name
-            
-        html_output_path = os.path.abspath(os.path.join(output_folder, f"{unique_name}_{postfix}.html"))
+    with _make_executor(len(notebook_files), template, max_workers) as executor:
+        futures = _submit_conversions(
+            executor, notebook_files, output_folder, postfix, execute, template, reuse_kernels, minify,
+            use_cache
+        )
+        return _collect_conversions(futures, custom_names)
 
-        # Build nbconvert command
-        nbconvert_cmd = ["jupyter", "nbconvert", "--to", "html", "--no-input", "--template", "basic"]
 
-        # Add execute flag if enabled
-        if execute:
-            nbconvert_cmd.append("--execute")
+def _read_notebook_html(html_file: str) -> bytes:
+    """
+    Read a converted notebook's HTML as UTF-8 bytes, ready to embed in a report.
 
-        # Add output path and notebook file
-        nbconvert_cmd.extend(["--output", html_output_path, notebook_file])
+    _finish_conversion has already applied RTL processing, so the file's
+    bytes are embedded without decoding them. Tags loading the BokehJS files
+    the report already loads in its <head> are left out; the converted file
+    itself keeps them, so it still works on its own.
+    """
+    with open(html_file, 'rb') as f:
+        html_bytes = f.read()
 
-        # Run nbconvert command with error handling
-        try:
-            print(f"Converting notebook: {notebook_file}")
-            result = subprocess.run(nbconvert_cmd, check=False, capture_output=True, text=True)
-
-            if result.returncode != 0:
-                print(f"Warning: Error executing notebook {notebook_file}. Converting without execution.")
-                print(f"Error details: {result.stderr}")
-
-                # If execution fails, try again without execution
-                if execute:
-                    # Remove --execute flag and related options
-                    basic_cmd = ["jupyter", "nbconvert", "--to", "html", "--no-input", "--template", "basic",
-                                "--output", html_output_path, notebook_file]
-                    print("Retrying conversion without execution...")
-                    subprocess.run(basic_cmd, check=True)
-        except Exception as e:
-            print(f"Error converting notebook {notebook_file}: {str(e)}")
-            # Continue with next notebook
+    # Only notebooks with Bokeh output reference its CDN, so most skip the regex
+    if b'cdn.bokeh.org' in html_bytes:
+        html_bytes = _BOKEH_CDN_TAG_RE.sub(b'', html_bytes)
+    return html_bytes
+
+
+def _read_ahead(html_files: list[str]) -> Iterator[bytes]:
+    """
+    Yield _read_notebook_html for each file in order, reading the next few in background threads.
+
+    At most _READ_AHEAD bodies are held at once, so the report is still
+    streamed, but reading the next notebooks overlaps with writing the
+    current one instead of waiting on each file in turn.
+    """
+    pending_files = iter(html_files)
+    with ThreadPoolExecutor(max_workers=_READ_AHEAD) as pool:
+        pending_reads = deque(
+            pool.submit(_read_notebook_html, html_file)
+            for html_file in itertools.islice(pending_files, _READ_AHEAD)
+        )
+        while pending_reads:
+            body = pending_reads.popleft().result()
+            for html_file in itertools.islice(pending_files, 1):
+                pending_reads.append(pool.submit(_read_notebook_html, html_file))
+            yield body
+
+
+def _find_shared_bodies(html_files: list[str]) -> dict[str, str]:
+    """
+    Find converted notebooks whose HTML appears more than once in a report.
+
+    This happens when a notebook is listed twice, e.g. under two topics, or
+    when two notebooks convert to identical HTML. Files are first grouped by
+    size, so only files that could be duplicates are read and hashed.
+
+    Args:
+        html_files (list[str]): Paths of the converted notebooks in report order.
+
+    Returns:
+        dict[str, str]: Maps each path whose content is shared to the id of
+            the <template> that holds that content, e.g. 'nb_1f0c9a2b3d4e5f60'.
+            Paths with unique content are left out.
+    """
+    occurrences = Counter(html_files)
+    paths_by_size = defaultdict(list)
+    for html_file in occurrences:
+        paths_by_size[os.path.getsize(html_file)].append(html_file)
+
+    paths_by_digest = defaultdict(list)
+    for same_size_paths in paths_by_size.values():
+        if len(same_size_paths) == 1 and occurrences[same_size_paths[0]] == 1:
             continue
+        for html_file in same_size_paths:
+            with open(html_file, 'rb') as f:
+                digest = hashlib.blake2b(f.read(), digest_size=8).hexdigest()
+            paths_by_digest[digest].append(html_file)
 
-        # Use custom name if provided, otherwise use default
-        display_name = notebook_name
-        if custom_names and len(custom_names) > len(converted_html_files):
-            display_name = custom_names[len(converted_html_files)]
+    shared_bodies = {}
+    for digest, paths in paths_by_digest.items():
+        if sum(occurrences[path] for path in paths) > 1:
+            for path in paths:
+                shared_bodies[path] = f"nb_{digest}"
+    return shared_bodies
 
-        # Return dict with both output_name (file path) and notebook_name (display name)
-        converted_html_files.append({
-            'output_name': html_output_path,
-            'notebook_name': display_name
-        })
 
-    return converted_html_files
+def _embedded_bodies(html_files: list[str], shared_bodies: dict[str, str]) -> Iterator[bytes]:
+    """
+    Yield the notebook bodies a report embeds, in the order its tab panes need them.
+
+    Every file is embedded except repeats of shared content, which
+    _notebook_body_fragments references instead of embedding again.
+    """
+    seen_templates = set()
+    files_to_embed = []
+    for html_file in html_files:
+        template_id = shared_bodies.get(html_file)
+        if template_id is None:
+            files_to_embed.append(html_file)
+        elif template_id not in seen_templates:
+            seen_templates.add(template_id)
+            files_to_embed.append(html_file)
+    return _read_ahead(files_to_embed)
+
+
+def _notebook_body_fragments(
+    html_file: str,
+    shared_bodies: dict[str, str],
+    emitted_templates: set[str],
+    bodies: Iterator[bytes]
+) -> Iterator[Union[str, bytes]]:
+    """
+    Yield the content of one notebook tab pane.
+
+    Notebooks with shared content are embedded once, in a <template> at their
+    first tab, and every tab showing them gets a placeholder that
+    _SHARED_BODY_SCRIPT fills in. Other notebooks are embedded directly.
+
+    Args:
+        html_file (str): Path of the converted notebook.
+        shared_bodies (dict[str, str]): Result of _find_shared_bodies.
+        emitted_templates (set[str]): Template ids already written to the
+            report. Updated in place.
+        bodies (Iterator[bytes]): Result of _embedded_bodies for the report;
+            the next body is taken from it whenever one is embedded.
+    """
+    template_id = shared_bodies.get(html_file)
+    if template_id is None:
+        yield next(bodies)
+        return
+
+    if template_id not in emitted_templates:
+        emitted_templates.add(template_id)
+        yield f'<template id="{template_id}">'
+        yield next(bodies)
+        yield '</template>'
+    yield f'<div class="nb-ref" data-nb="{template_id}"></div>'
+
+
+def _lazy_pane_sources(html_files: list[str], report_folder: str) -> dict[str, str]:
+    """
+    Find the data-src each lazily loaded tab pane fetches its notebook from.
+
+    Converted notebooks are already RTL-processed, so each pane loads its
+    converted file directly.
+
+    Args:
+        html_files (list[str]): Paths of the converted notebooks in report order.
+        report_folder (str): Directory the report is written to.
+
+    Returns:
+        dict[str, str]: Maps each path to its URL-quoted path relative to
+            report_folder, ready to use as a data-src attribute.
+    """
+    pane_sources = {}
+    for html_file in dict.fromkeys(html_files):
+        relative_path = os.path.relpath(html_file, report_folder)
+        pane_sources[html_file] = urllib.parse.quote(relative_path.replace(os.sep, '/'))
+    return pane_sources
 
 
 def _generate_nested_html_template(
     html_files: dict,
     report_title: str,
     current_datetime: str,
-    tabs_names: Union[dict, None] = None
-) -> str:
+    tabs_names: Union[dict, None] = None,
+    lazy_load_from: Union[str, None] = None
+) -> Iterator[Union[str, bytes]]:
     """
     Generate HTML template for nested tabs structure with hierarchical organization.
 
@@ -280,7 +1395,7 @@ def _generate_nested_html_template(
             Format: {topic_name: [{'output_name': str, 'notebook_name': str}, ...]}
 
         report_title (str):
-            Title to display at the top of the report page.
+            Title to display at the top of the report page. HTML-escaped.
 
         current_datetime (str):
             Timestamp string for report generation time display.
@@ -292,8 +1407,20 @@ def _generate_nested_html_template(
             2. Advanced: {topic_key: {'topic_name': str, 'notebook_names': [str...]}}
             Defaults to None (uses original names).
 
-    Returns:
-        str: Complete HTML document with nested tabs interface.
+        lazy_load_from (Union[str, None], optional):
+            Directory the report is written to. When given, notebooks are not
+            embedded; each sub-tab pane gets a data-src with the notebook's
+            path relative to this directory, and the browser fetches it the
+            first time the tab is shown. Defaults to None (embed notebooks).
+
+    Yields:
+        Union[str, bytes]: Consecutive fragments of the HTML document with
+            nested tabs interface. Markup is yielded as str and notebook
+            bodies as UTF-8 bytes. Notebook HTML files are read a few at a
+            time, just ahead of their tab content, so the report can be
+            written as it is generated without holding every notebook in
+            memory.
+            Notebooks that appear more than once are embedded only once.
 
     Template Structure:
         - Bootstrap-based responsive design
@@ -316,12 +1443,16 @@ def _generate_nested_html_template(
         - Image centering and size constraints
         - Table structure preservation in mixed-direction content
     """
+    # Escaped once here, since the title is interpolated into both <title> and <h1>
+    report_title = html.escape(report_title)
+    current_datetime = html.escape(current_datetime)
+
+    # Main tabs only need the topic names, so build them before any notebook is read
     main_tabs = []
-    main_contents = []
 
-    for i, (topic_name, topic_html_files) in enumerate(html_files.items()):
+    for i, topic_name in enumerate(html_files):
         topic_id = f"topic{i}"
-        is_active = i == 0
+        active_cls, aria_selected, _ = _TAB_STATES[i == 0]
 
         # Use custom topic name if provided
         display_topic_name = topic_name
@@ -335,167 +1466,32 @@ def _generate_nested_html_template(
 
         # Create main tab
         main_tabs.append(
-            f'<li class="nav-item"><a class="nav-link {"active" if is_active else ""}" '
+            f'<li class="nav-item"><a class="nav-link {active_cls}" '
             f'id="{topic_id}-tab" data-bs-toggle="tab" href="#{topic_id}" role="tab" '
-            f'aria-controls="{topic_id}" aria-selected="{"true" if is_active else "false"}">'
+            f'aria-controls="{topic_id}" aria-selected="{aria_selected}">'
             f'{display_topic_name}</a></li>'
         )
 
-        # Generate sub-tabs for notebooks within this topic
-        sub_tabs = []
-        sub_contents = []
-
-        for j, html_file_info in enumerate(topic_html_files):
-            # html_file_info is now a dict with 'output_name' and 'notebook_name'
-            html_file = html_file_info['output_name']
-            notebook_name = html_file_info['notebook_name']
-            sub_tab_id = f"{topic_id}_sub{j}"
-            is_sub_active = j == 0
-
-            with open(html_file, 'r', encoding='utf-8') as f:
-                html_content = _apply_rtl_processing(f.read())
-
-            # Sub-tab navigation
-            sub_tabs.append(
-                f'<li class="nav-item"><a class="nav-link {"active" if is_sub_active else ""}" '
-                f'id="{sub_tab_id}-tab" data-bs-toggle="tab" href="#{sub_tab_id}" role="tab" '
-                f'aria-controls="{sub_tab_id}" aria-selected="{"true" if is_sub_active else "false"}">'
-                f'{notebook_name}</a></li>'
-            )
-
-            # Sub-tab content
-            sub_contents.append(
-                f'<div class="tab-pane fade {"show active" if is_sub_active else ""}" '
-                f'id="{sub_tab_id}" role="tabpanel" aria-labelledby="{sub_tab_id}-tab">'
-                f'{html_content}</div>'
-            )
-
-        # Create main tab content with nested tabs
-        main_content = f'''
-        <div class="tab-pane fade {"show active" if is_active else ""}" id="{topic_id}" role="tabpanel" aria-labelledby="{topic_id}-tab">
-            <div class="nested-tabs-container">
-                <ul class="nav nav-pills nav-justified mb-3" id="{topic_id}-subtabs" role="tablist">
-                    {''.join(sub_tabs)}
-                </ul>
-                <div class="tab-content" id="{topic_id}-subtab-content">
-                    {''.join(sub_contents)}
-                </div>
-            </div>
-        </div>
-        '''
-        main_contents.append(main_content)
-
-    custom_css = """
-    <style>
-        .nested-tabs-container {
-            margin-top: 20px;
-        }
-
-        .nav-pills .nav-link {
-            background-color: #f8f9fa;
-            color: #495057;
-            margin: 0 2px;
-            border-radius: 0.375rem;
-        }
-
-        .nav-pills .nav-link.active {
-            background-color: #0d6efd;
-            color: white;
-        }
-
-        .nav-pills .nav-link:hover {
-            background-color: #e9ecef;
-            color: #495057;
-        }
-
-        .nav-pills .nav-link.active:hover {
-            background-color: #0b5ed7;
-            color: white;
-        }
-
-        .tab-content {
-            background-color: white;
-            border: 1px solid #dee2e6;
-            border-radius: 0.375rem;
-            padding: 20px;
-            margin-top: 10px;
-        }
-
-        .main-tabs .nav-tabs .nav-link {
-            font-weight: 500;
-            font-size: 1.1em;
-        }
-
-        .nested-tabs-container .nav-pills .nav-link {
-            font-size: 0.95em;
-        }
-
-        body {
-            background-color: #f8f9fa;
-        }
-
-        .container {
-            background-color: white;
-            border-radius: 0.5rem;
-            box-shadow: 0 0.125rem 0.25rem rgba(0, 0, 0, 0.075);
-            padding: 2rem;
-            margin-top: 2rem;
-            margin-bottom: 2rem;
-        }
-
-        /* Prevent image overflow and horizontal scrolling */
-        img {
-            max-width: 100%;
-            height: auto;
-            display: block;
-        }
-
-        /* RTL Support - Targeted approach using special class */
-        .rtl-text-content {
-            direction: rtl !important;
-            text-align: right !important;
-            display: inline !important;
-            margin: 0 !important;
-            padding: 0 !important;
-            font-size: inherit !important;
-            font-weight: inherit !important;
-            line-height: inherit !important;
-            color: inherit !important;
-        }
-        
-        /* Ensure all other elements remain LTR (images, code, etc.) */
-        img, figure, .output_png, .output_jpeg, code, pre {
-            direction: ltr !important;
-            text-align: left !important;
-        }
-        
-        /* Specific image centering */
-        .output_png img, .output_jpeg img {
-            display: block !important;
-            margin: 0 auto !important;
-        }
-
-        /* Keep table structure LTR even if cells have RTL text */
-        table {
-            direction: ltr;
-        }
-    </style>
-    """
+    report_files = [
+        html_file_info['output_name']
+        for topic_html_files in html_files.values()
+        for html_file_info in topic_html_files
+    ]
+    emitted_templates = set()
+    if lazy_load_from is None:
+        pane_sources = {}
+        shared_bodies = _find_shared_bodies(report_files)
+        bodies = _embedded_bodies(report_files, shared_bodies)
+    else:
+        pane_sources = _lazy_pane_sources(report_files, lazy_load_from)
 
-    return f"""
+    yield f"""
     <!DOCTYPE html>
     <html lang="en">
     <head>
-        <meta charset="UTF-8">
-        <meta name="viewport" content="width=device-width, initial-scale=1.0">
-        <link href="https://cdn.jsdelivr.net/npm/bootstrap@5.1.3/dist/css/bootstrap.min.css" rel="stylesheet">
-        <link rel="stylesheet" href="https://cdn.bokeh.org/bokeh/release/bokeh-3.3.0.min.css" type="text/css" />
-
-        <script src="https://cdn.bokeh.org/bokeh/release/bokeh-3.3.0.min.js"></script>
-        <script src="https://cdn.bokeh.org/bokeh/release/bokeh-widgets-3.3.0.min.js"></script>
-        <script src="https://cdn.bokeh.org/bokeh/release/bokeh-tables-3.3.0.min.js"></script>
+        {_HEAD_ASSETS}
         <title>{report_title}</title>
-        {custom_css}
+        {_NESTED_CSS}
     </head>
 
     <body>
@@ -510,12 +1506,72 @@ def _generate_nested_html_template(
                     {''.join(main_tabs)}
                 </ul>
                 <div class="tab-content" id="mainTabContent">
-                    {''.join(main_contents)}
+                    """
+
+    for i, topic_html_files in enumerate(html_files.values()):
+        topic_id = f"topic{i}"
+        _, _, show_active = _TAB_STATES[i == 0]
+
+        # Generate sub-tabs for notebooks within this topic
+        sub_tabs = []
+
+        for j, html_file_info in enumerate(topic_html_files):
+            # html_file_info is now a dict with 'output_name' and 'notebook_name'
+            notebook_name = html_file_info['notebook_name']
+            sub_tab_id = f"{topic_id}_sub{j}"
+            sub_active_cls, sub_aria_selected, _ = _TAB_STATES[j == 0]
+
+            # Sub-tab navigation
+            sub_tabs.append(
+                f'<li class="nav-item"><a class="nav-link {sub_active_cls}" '
+                f'id="{sub_tab_id}-tab" data-bs-toggle="tab" href="#{sub_tab_id}" role="tab" '
+                f'aria-controls="{sub_tab_id}" aria-selected="{sub_aria_selected}">'
+                f'{notebook_name}</a></li>'
+            )
+
+        # Open main tab content with nested tabs
+        yield f'''
+        <div class="tab-pane fade {show_active}" id="{topic_id}" role="tabpanel" aria-labelledby="{topic_id}-tab">
+            <div class="nested-tabs-container">
+                <ul class="nav nav-pills nav-justified mb-3" id="{topic_id}-subtabs" role="tablist">
+                    {''.join(sub_tabs)}
+                </ul>
+                <div class="tab-content" id="{topic_id}-subtab-content">
+                    '''
+
+        # Sub-tab content, with the next notebooks read ahead in the background
+        for j, html_file_info in enumerate(topic_html_files):
+            html_file = html_file_info['output_name']
+            sub_tab_id = f"{topic_id}_sub{j}"
+            _, _, sub_show_active = _TAB_STATES[j == 0]
+
+            data_src = f' data-src="{pane_sources[html_file]}"' if pane_sources else ''
+            yield (
+                f'<div class="tab-pane fade {sub_show_active}" '
+                f'id="{sub_tab_id}" role="tabpanel" aria-labelledby="{sub_tab_id}-tab"{data_src}>'
+            )
+            if not pane_sources:
+                yield from _notebook_body_fragments(html_file, shared_bodies, emitted_templates, bodies)
+            yield '</div>'
+
+        # Close main tab content
+        yield '''
                 </div>
             </div>
         </div>
+        '''
 
-        <script src="https://cdn.jsdelivr.net/npm/bootstrap@5.1.3/dist/js/bootstrap.bundle.min.js"></script>
+    yield """
+                </div>
+            </div>
+        </div>
+
+        """
+    if emitted_templates:
+        yield _SHARED_BODY_SCRIPT
+    if pane_sources:
+        yield _LAZY_LOAD_SCRIPT
+    yield """<script src="https://cdn.jsdelivr.net/npm/bootstrap@5.1.3/dist/js/bootstrap.bundle.min.js"></script>
     </body>
     </html>
     """
@@ -525,7 +1581,7 @@ def _generate_single_html_template(
     html_file_info: dict,
     report_title: str,
     current_datetime: str
-) -> str:
+) -> Iterator[Union[str, bytes]]:
     """
     Generate HTML template for a single notebook without tabs interface.
 
@@ -540,14 +1596,16 @@ def _generate_single_html_template(
             - 'notebook_name' (str): Display name for the notebook
 
         report_title (str):
-            Title to display at the top of the report page.
+            Title to display at the top of the report page. HTML-escaped.
             Used as the main heading since there are no tabs.
 
         current_datetime (str):
             Timestamp string showing when the report was generated.
 
-    Returns:
-        str: Complete HTML document containing the single notebook.
+    Yields:
+        Union[str, bytes]: The HTML document containing the single notebook,
+            as the markup before the notebook, the notebook body as UTF-8
+            bytes, and the markup after it.
 
     Template Features:
         - Clean, centered layout with Bootstrap styling
@@ -568,87 +1626,20 @@ def _generate_single_html_template(
         - Identical RTL text processing capabilities
         - Compatible with all notebook output types
     """
+    # Escaped once here, since the title is interpolated into both <title> and <h1>
+    report_title = html.escape(report_title)
+    current_datetime = html.escape(current_datetime)
+
     # html_file_info is now a dict with 'output_name' and 'notebook_name'
     html_file = html_file_info['output_name']
-    with open(html_file, 'r', encoding='utf-8') as f:
-        html_content = _apply_rtl_processing(f.read())
-
-    custom_css = """
-    <style>
-        body {
-            background-color: #f8f9fa;
-        }
-
-        .container {
-            background-color: white;
-            border-radius: 0.5rem;
-            box-shadow: 0 0.125rem 0.25rem rgba(0, 0, 0, 0.075);
-            padding: 2rem;
-            margin-top: 2rem;
-            margin-bottom: 2rem;
-        }
-
-        .content {
-            background-color: white;
-            border: 1px solid #dee2e6;
-            border-radius: 0.375rem;
-            padding: 20px;
-            margin-top: 10px;
-        }
-
-        /* Prevent image overflow and horizontal scrolling */
-        img {
-            max-width: 100%;
-            height: auto;
-            display: block;
-        }
-
-        /* RTL Support - Targeted approach using special class */
-        .rtl-text-content {
-            direction: rtl !important;
-            text-align: right !important;
-            display: inline !important;
-            margin: 0 !important;
-            padding: 0 !important;
-            font-size: inherit !important;
-            font-weight: inherit !important;
-            line-height: inherit !important;
-            color: inherit !important;
-        }
-        
-        /* Ensure all other elements remain LTR (images, code, etc.) */
-        img, figure, .output_png, .output_jpeg, code, pre {
-            direction: ltr !important;
-            text-align: left !important;
-        }
-        
-        /* Specific image centering */
-        .output_png img, .output_jpeg img {
-            display: block !important;
-            margin: 0 auto !important;
-        }
 
-        /* Keep table structure LTR even if cells have RTL text */
-        table {
-            direction: ltr;
-        }
-    </style>
-    """
-
-    return f"""
+    yield f"""
     <!DOCTYPE html>
     <html lang="en">
     <head>
-        <meta charset="UTF-8">
-        <meta name="viewport" content="width=device-width, initial-scale=1.0">
-        <link href="https://cdn.jsdelivr.net/npm/bootstrap@5.1.3/dist/css/bootstrap.min.css" rel="stylesheet">
-        <link rel="stylesheet" href="https://cdn.bokeh.org/bokeh/release/bokeh-3.3.0.min.css" type="text/css" />
-
-        <script src="https://cdn.bokeh.org/bokeh/release/bokeh-3.3.0.min.js"></script>
-        <script src="https://cdn.bokeh.org/bokeh/release/bokeh-widgets-3.3.0.min.js"></script>
-        <script src="https://cdn.bokeh.org/bokeh/release/bokeh-tables-3.3.0.min.js"></script>
+        {_HEAD_ASSETS}
         <title>{report_title}</title>
-        {custom_css}
+        {_SINGLE_CSS}
         <script src="https://cdn.jsdelivr.net/npm/bootstrap@5.1.3/dist/js/bootstrap.bundle.min.js"></script>
     </head>
 
@@ -659,7 +1650,9 @@ def _generate_single_html_template(
                 <p class="text-muted">Generated on: {current_datetime}</p>
             </div>
             <div class="content">
-                {html_content}
+                """
+    yield _read_notebook_html(html_file)
+    yield """
             </div>
         </div>
     </body>
@@ -670,8 +1663,9 @@ def _generate_single_html_template(
 def _generate_flat_html_template(
     html_files: list[dict],
     report_title: str,
-    current_datetime: str
-) -> str:
+    current_datetime: str,
+    lazy_load_from: Union[str, None] = None
+) -> Iterator[Union[str, bytes]]:
     """
     Generate HTML template for flat tabs structure with single-level navigation.
 
@@ -687,13 +1681,23 @@ def _generate_flat_html_template(
             - 'notebook_name' (str): Display name for the notebook tab
 
         report_title (str):
-            Title to display at the top of the report page.
+            Title to display at the top of the report page. HTML-escaped.
 
         current_datetime (str):
             Timestamp string for report generation time display.
 
-    Returns:
-        str: Complete HTML document with flat tabs interface.
+        lazy_load_from (Union[str, None], optional):
+            Directory the report is written to. When given, notebooks are not
+            embedded; each tab pane gets a data-src with the notebook's path
+            relative to this directory, and the browser fetches it the first
+            time the tab is shown. Defaults to None (embed notebooks).
+
+    Yields:
+        Union[str, bytes]: Consecutive fragments of the HTML document with
+            flat tabs interface. Markup is yielded as str and notebook bodies
+            as UTF-8 bytes. Notebook HTML files are read a few at a time,
+            just ahead of their tab content. Notebooks that appear more than once
+            are embedded only once.
 
     Template Structure:
         - Bootstrap nav-tabs for horizontal tab navigation
@@ -725,120 +1729,36 @@ def _generate_flat_html_template(
         - Names can be customized via tabs_names in parent functions
         - Falls back to filename-based naming if not specified
     """
+    # Escaped once here, since the title is interpolated into both <title> and <h1>
+    report_title = html.escape(report_title)
+    current_datetime = html.escape(current_datetime)
+
+    # Tabs only need the notebook names, so build them before any notebook is read
     html_tabs = []
-    html_contents = []
 
     for i, html_file_info in enumerate(html_files):
         # html_file_info is now a dict with 'output_name' and 'notebook_name'
-        html_file = html_file_info['output_name']
         notebook_name = html_file_info['notebook_name']
-        with open(html_file, 'r', encoding='utf-8') as f:
-            html_content = _apply_rtl_processing(f.read())
-
-        # Add HTML content to tab
+        active_cls, aria_selected, _ = _TAB_STATES[i == 0]
         html_tabs.append(
-            f'<li class="nav-item"><a class="nav-link {"active" if i == 0 else ""}" id="tab{i}-link" data-bs-toggle="tab" href="#tab{i}" role="tab" aria-controls="tab{i}" aria-selected="{"true" if i == 0 else "false"}">{notebook_name}</a></li>')
-        html_contents.append(
-            f'<div class="tab-pane fade {"show active" if i == 0 else ""}" id="tab{i}" role="tabpanel" aria-labelledby="tab{i}-link">{html_content}</div>')
-
-    custom_css = """
-    <style>
-        .nav-pills .nav-link {
-            background-color: #f8f9fa;
-            color: #495057;
-            margin: 0 2px;
-            border-radius: 0.375rem;
-        }
-
-        .nav-pills .nav-link.active {
-            background-color: #0d6efd;
-            color: white;
-        }
-
-        .nav-pills .nav-link:hover {
-            background-color: #e9ecef;
-            color: #495057;
-        }
-
-        .nav-pills .nav-link.active:hover {
-            background-color: #0b5ed7;
-            color: white;
-        }
-
-        .tab-content {
-            background-color: white;
-            border: 1px solid #dee2e6;
-            border-radius: 0.375rem;
-            padding: 20px;
-            margin-top: 10px;
-        }
-
-        body {
-            background-color: #f8f9fa;
-        }
-
-        .container {
-            background-color: white;
-            border-radius: 0.5rem;
-            box-shadow: 0 0.125rem 0.25rem rgba(0, 0, 0, 0.075);
-            padding: 2rem;
-            margin-top: 2rem;
-            margin-bottom: 2rem;
-        }
-
-        /* Prevent image overflow and horizontal scrolling */
-        img {
-            max-width: 100%;
-            height: auto;
-            display: block;
-        }
-
-        /* RTL Support - Targeted approach using special class */
-        .rtl-text-content {
-            direction: rtl !important;
-            text-align: right !important;
-            display: inline !important;
-            margin: 0 !important;
-            padding: 0 !important;
-            font-size: inherit !important;
-            font-weight: inherit !important;
-            line-height: inherit !important;
-            color: inherit !important;
-        }
-        
-        /* Ensure all other elements remain LTR (images, code, etc.) */
-        img, figure, .output_png, .output_jpeg, code, pre {
-            direction: ltr !important;
-            text-align: left !important;
-        }
-        
-        /* Specific image centering */
-        .output_png img, .output_jpeg img {
-            display: block !important;
-            margin: 0 auto !important;
-        }
-
-        /* Keep table structure LTR even if cells have RTL text */
-        table {
-            direction: ltr;
-        }
-    </style>
-    """
+            f'<li class="nav-item"><a class="nav-link {active_cls}" id="tab{i}-link" data-bs-toggle="tab" href="#tab{i}" role="tab" aria-controls="tab{i}" aria-selected="{aria_selected}">{notebook_name}</a></li>')
+
+    report_files = [html_file_info['output_name'] for html_file_info in html_files]
+    emitted_templates = set()
+    if lazy_load_from is None:
+        pane_sources = {}
+        shared_bodies = _find_shared_bodies(report_files)
+        bodies = _embedded_bodies(report_files, shared_bodies)
+    else:
+        pane_sources = _lazy_pane_sources(report_files, lazy_load_from)
 
-    return f"""
+    yield f"""
     <!DOCTYPE html>
     <html lang="en">
     <head>
-        <meta charset="UTF-8">
-        <meta name="viewport" content="width=device-width, initial-scale=1.0">
-        <link href="https://cdn.jsdelivr.net/npm/bootstrap@5.1.3/dist/css/bootstrap.min.css" rel="stylesheet">
-        <link rel="stylesheet" href="https://cdn.bokeh.org/bokeh/release/bokeh-3.3.0.min.css" type="text/css" />
-
-        <script src="https://cdn.bokeh.org/bokeh/release/bokeh-3.3.0.min.js"></script>
-        <script src="https://cdn.bokeh.org/bokeh/release/bokeh-widgets-3.3.0.min.js"></script>
-        <script src="https://cdn.bokeh.org/bokeh/release/bokeh-tables-3.3.0.min.js"></script>
+        {_HEAD_ASSETS}
         <title>{report_title}</title>
-        {custom_css}
+        {_FLAT_CSS}
         <script src="https://cdn.jsdelivr.net/npm/bootstrap@5.1.3/dist/js/bootstrap.bundle.min.js"></script>
     </head>
 
@@ -852,10 +1772,28 @@ def _generate_flat_html_template(
                 {''.join(html_tabs)}
             </ul>
             <div class="tab-content">
-                {''.join(html_contents)}
+                """
+
+    # Tab content, with the next notebooks read ahead in the background
+    for i, html_file_info in enumerate(html_files):
+        html_file = html_file_info['output_name']
+
+        _, _, show_active = _TAB_STATES[i == 0]
+        data_src = f' data-src="{pane_sources[html_file]}"' if pane_sources else ''
+        yield f'<div class="tab-pane fade {show_active}" id="tab{i}" role="tabpanel" aria-labelledby="tab{i}-link"{data_src}>'
+        if not pane_sources:
+            yield from _notebook_body_fragments(html_file, shared_bodies, emitted_templates, bodies)
+        yield '</div>'
+
+    yield """
             </div>
         </div>
-    </body>
+    """
+    if emitted_templates:
+        yield _SHARED_BODY_SCRIPT
+    if pane_sources:
+        yield _LAZY_LOAD_SCRIPT
+    yield """</body>
     </html>
     """
 
@@ -866,8 +1804,10 @@ def generate_final_report(
     report_title: str,
     output_folder: str,
     current_datetime: str,
-    tabs_names: Union[dict, list, None] = None
-) -> None:
+    tabs_names: Union[dict, list, None] = None,
+    gzip_report: bool = False,
+    lazy_load: bool = False
+) -> str:
     """
     Generate the final HTML report by selecting appropriate template and writing output.
 
@@ -898,8 +1838,20 @@ def generate_final_report(
             Custom naming configuration passed to template generators.
             Format depends on report structure. Defaults to None.
 
+        gzip_report (bool, optional):
+            Also write a gzip-compressed copy of the report next to it, as
+            {report_filename}.gz, for servers that serve precompressed files.
+            Defaults to False.
+
+        lazy_load (bool, optional):
+            Leave the notebooks out of a flat or nested report and have the
+            browser fetch each one from output_folder the first time its tab
+            is shown. The report then needs the notebook HTML files next to
+            it and must be served over HTTP. Single notebook reports always
+            embed the notebook. Defaults to False.
+
     Returns:
-        None: Function writes file and prints confirmation message.
+        str: Path of the written report. The function also prints it.
 
     Report Structure Detection:
         1. Single notebook: dict with 'output_name' and 'notebook_name' keys
@@ -917,29 +1869,52 @@ def generate_final_report(
         - Flat: _generate_flat_html_template()
 
     Output:
-        - Writes complete HTML file to disk
+        - Streams the HTML to disk as the template generates it
+        - With gzip_report, compresses the same stream into a .gz copy
         - Prints confirmation with full file path
         - File ready for browser viewing or web deployment
     """
 
-    if isinstance(html_files, dict) and not ('output_name' in html_files and 'notebook_name' in html_files):
-        # This is a nested structure (dict of topics -> lists of html files)
-        template_str = _generate_nested_html_template(html_files, report_title, current_datetime, tabs_names)
-    elif isinstance(html_files, dict) and 'output_name' in html_files and 'notebook_name' in html_files:
+    lazy_load_from = output_folder if lazy_load else None
+    if not isinstance(html_files, dict):
+        # This is a flat list of notebook dicts
+        template_fragments = _generate_flat_html_template(html_files, report_title, current_datetime, lazy_load_from)
+    elif 'output_name' in html_files and 'notebook_name' in html_files:
         # This is a single notebook dict
-        template_str = _generate_single_html_template(html_files, report_title, current_datetime)
+        template_fragments = _generate_single_html_template(html_files, report_title, current_datetime)
     else:
-        # This is a flat list of notebook dicts
-        template_str = _generate_flat_html_template(html_files, report_title, current_datetime)
+        # This is a nested structure (dict of topics -> lists of html files)
+        template_fragments = _generate_nested_html_template(
+            html_files, report_title, current_datetime, tabs_names, lazy_load_from
+        )
 
-    # Write final report
+    # Write final report, fragment by fragment as the template produces them
     report_filename = f"{report_title.replace(' ', '_')}_{current_datetime}.html"
     report_path = os.path.join(output_folder, report_filename)
+    os.makedirs(output_folder, exist_ok=True)
+
+    # Notebook bodies arrive already encoded; only the markup needs encoding
+    with contextlib.ExitStack() as stack:
+        writers = [stack.enter_context(open(report_path, 'wb', buffering=_REPORT_WRITE_BUFFER))]
+        if gzip_report:
+            writers.append(stack.enter_context(gzip.open(f"{report_path}.gz", 'wb', compresslevel=6)))
 
-    with open(report_path, 'w', encoding='utf-8') as f:
-        f.write(template_str)
+        for fragment in template_fragments:
+            data = fragment if isinstance(fragment, bytes) else fragment.encode('utf-8')
+            for writer in writers:
+                writer.write(data)
 
     print(f"Report saved to: {report_path}")
+    return report_path
+
+
+def _list_notebooks(directory: str) -> list[str]:
+    """List the paths of the non-hidden .ipynb files directly inside a directory."""
+    with os.scandir(directory) as entries:
+        return [
+            entry.path for entry in entries
+            if entry.name.endswith('.ipynb') and not entry.name.startswith('.') and entry.is_file()
+        ]
 
 
 def _discover_notebooks_from_directory(notebook_dir: str) -> Union[dict, list]:
@@ -966,11 +1941,11 @@ def _discover_notebooks_from_directory(notebook_dir: str) -> Union[dict, list]:
 
     Directory Scanning Logic:
         1. Check if target directory exists
-        2. Find all .ipynb files in root directory
-        3. Identify subdirectories (excluding hidden dirs starting with '.')
-        4. Scan each subdirectory for .ipynb files
-        5. Build nested structure if subdirectories contain notebooks
-        6. Return flat structure if only root notebooks found
+        2. Scan the root directory once, sorting entries into .ipynb files
+           and subdirectories (hidden entries starting with '.' are skipped)
+        3. Scan each subdirectory once for .ipynb files
+        4. Build nested structure if subdirectories contain notebooks
+        5. Return flat structure if only root notebooks found
 
     Nested Structure Rules:
         - Each subdirectory becomes a topic/category
@@ -996,16 +1971,23 @@ def _discover_notebooks_from_directory(notebook_dir: str) -> Union[dict, list]:
         - Discovery mode for unknown directory structures
         - Batch processing of notebook repositories
     """
-    if not os.path.exists(notebook_dir):
+    try:
+        entries = os.scandir(notebook_dir)
+    except FileNotFoundError:
         print(f"Directory does not exist: {notebook_dir}")
         return []
 
-    # Get all .ipynb files in root directory
-    root_notebooks = glob.glob(os.path.join(notebook_dir, "*.ipynb"))
-
-    # Get all subdirectories
-    subdirs = [d for d in os.listdir(notebook_dir)
-               if os.path.isdir(os.path.join(notebook_dir, d)) and not d.startswith('.')]
+    # Classify the root entries in one pass; DirEntry caches the file type, so no extra stat calls
+    root_notebooks = []
+    subdirs = []
+    with entries:
+        for entry in entries:
+            if entry.name.startswith('.'):
+                continue
+            if entry.is_dir():
+                subdirs.append(entry)
+            elif entry.name.endswith('.ipynb') and entry.is_file():
+                root_notebooks.append(entry.path)
 
     if not subdirs:
         # No subdirectories, return flat structure
@@ -1026,22 +2008,94 @@ def _discover_notebooks_from_directory(notebook_dir: str) -> Union[dict, list]:
 
     # Process each subdirectory
     for subdir in subdirs:
-        if subdir.startswith('.'):
-            continue
-        subdir_path = os.path.join(notebook_dir, subdir)
-        subdir_notebooks = glob.glob(os.path.join(subdir_path, "*.ipynb"))
+        subdir_notebooks = _list_notebooks(subdir.path)
 
         if subdir_notebooks:
             # Use subdirectory name as topic name (clean it up)
-            topic_name = subdir.replace('_', ' ').replace('-', ' ').title()
+            topic_name = subdir.name.translate(_WORD_SEPARATOR_TO_SPACE).title()
             nested_structure[topic_name] = subdir_notebooks
-            print(f"Found {len(subdir_notebooks)} notebooks in '{subdir}' -> '{topic_name}' category")
+            print(f"Found {len(subdir_notebooks)} notebooks in '{subdir.name}' -> '{topic_name}' category")
 
     if not nested_structure:
         print(f"No notebooks found in {notebook_dir} or its subdirectories")
         return []
 
     return nested_structure
+
+
+def _file_digest(path: str) -> Union[str, None]:
+    """SHA-256 of a file's content, or None if it can't be read."""
+    try:
+        with open(path, 'rb') as f:
+            return hashlib.sha256(f.read()).hexdigest()
+    except OSError:
+        return None
+
+
+def _report_fingerprint(options: dict, notebook_files: Union[str, list, dict]) -> dict:
+    """
+    Describe everything a report is generated from.
+
+    Two runs with equal fingerprints produce the same report, apart from
+    its timestamp.
+
+    Args:
+        options (dict): The options the report is generated with, after
+            defaults are filled in and unavailable ones are turned off, so
+            e.g. a run that couldn't minify doesn't match one that did.
+        notebook_files (Union[str, list, dict]): The notebooks going into the
+            report, after directory discovery, in any notebook_files format.
+
+    Returns:
+        dict: Hashes of the options, of this module (which holds the report
+            templates) and of each notebook file, and the nbconvert version.
+    """
+    if isinstance(notebook_files, dict):
+        notebook_paths = [path for topic_notebooks in notebook_files.values() for path in topic_notebooks]
+    elif isinstance(notebook_files, str):
+        notebook_paths = [notebook_files]
+    else:
+        notebook_paths = list(notebook_files)
+
+    # Read from the package metadata, as importing nbconvert is slow and may not be needed
+    try:
+        nbconvert_version = importlib.metadata.version('nbconvert')
+    except importlib.metadata.PackageNotFoundError:
+        nbconvert_version = None
+
+    return {
+        'config': hashlib.sha256(json.dumps(options, sort_keys=True).encode('utf-8')).hexdigest(),
+        'generator': _file_digest(__file__),
+        'nbconvert': nbconvert_version,
+        'notebooks': {path: _file_digest(path) for path in notebook_paths}
+    }
+
+
+def _up_to_date_report(output_folder: str, fingerprint: dict) -> Union[str, None]:
+    """
+    Return the path of the last report if it was built from the same inputs.
+
+    Returns None when there is no manifest, the fingerprint changed or the
+    report file is gone.
+    """
+    try:
+        with open(os.path.join(output_folder, _MANIFEST_NAME), 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return None
+
+    report_path = manifest.get('report_path')
+    if manifest.get('fingerprint') != fingerprint or not report_path or not os.path.exists(report_path):
+        return None
+    return report_path
+
+
+def _write_manifest(output_folder: str, fingerprint: dict, report_path: str) -> None:
+    """Record the fingerprint a report was built from, for _up_to_date_report."""
+    with open(os.path.join(output_folder, _MANIFEST_NAME), 'w', encoding='utf-8') as f:
+        json.dump({'fingerprint': fingerprint, 'report_path': report_path}, f, indent=2)
+
+
 # Main function
 def generate_report(config_path: str) -> None:
     """
@@ -1068,6 +2122,14 @@ def generate_report(config_path: str) -> None:
 
         Optional fields:
         - 'execute': Whether to run notebooks before conversion (default: False)
+        - 'nbconvert_template': nbconvert HTML template (default: "basic")
+        - 'max_workers': Notebooks converted at the same time (default: CPU count)
+        - 'reuse_kernels': Execute each worker's notebooks in one shared kernel (default: False)
+        - 'minify_notebooks': Minify each converted notebook with minify-html (default: False)
+        - 'gzip_report': Also write a gzip-compressed copy of the report (default: False)
+        - 'lazy_load_notebooks': Load each notebook when its tab is first shown (default: False)
+        - 'cache_executed_notebooks': Reuse executed outputs of unchanged notebooks (default: False)
+        - 'force': Regenerate the report and reconvert every notebook, bypassing the cache (default: False)
         - 'tabs_names': Custom tab naming (see Custom Naming section)
         - 'notebook_dir': Directory for auto-discovery when notebook_files empty
 
@@ -1086,10 +2148,11 @@ def generate_report(config_path: str) -> None:
         1. Load and validate configuration file
         2. Extract notebook files and settings
         3. Handle auto-discovery if notebook_files empty
-        4. Convert notebooks to HTML with optional execution
-        5. Apply custom naming if provided
-        6. Generate appropriate report template
-        7. Write final HTML report to output folder
+        4. Stop early if the last report was built from the same inputs
+        5. Convert notebooks to HTML with optional execution
+        6. Apply custom naming if provided
+        7. Generate appropriate report template
+        8. Write final HTML report to output folder
 
     Execution Mode:
         - When execute=True: Runs all notebook cells before conversion
@@ -1138,6 +2201,40 @@ def generate_report(config_path: str) -> None:
     output_folder = config.get("output_folder", "./output")
     report_title = config.get("report_title", "Jupyter tabs Notebooks Report")
     execute = config.get("execute", False)
+    template = config.get("nbconvert_template", _DEFAULT_TEMPLATE)
+    max_workers = config.get("max_workers", None)
+    gzip_report = config.get("gzip_report", False)
+    lazy_load = config.get("lazy_load_notebooks", False)
+    reuse_kernels = config.get("reuse_kernels", False)
+    minify = config.get("minify_notebooks", False)
+    force = config.get("force", False)
+    # Executed notebooks are run again on every report unless reusing their outputs is opted into,
+    # since their outputs can change (e.g. new data) while the notebook file stays the same
+    use_cache = not force and (not execute or config.get("cache_executed_notebooks", False))
+    if minify and minify_html is None:
+        print("Warning: minify_notebooks needs the minify-html package (pip install minify-html). "
+              "Notebooks will not be minified.")
+        minify = False
+
+    # Skip all the work if the options, the notebooks and the templates haven't changed.
+    # 'force' is left out, since it doesn't change the report.
+    report_options = {key: value for key, value in config.items() if key != 'force'}
+    report_options.update({
+        'output_folder': output_folder,
+        'report_title': report_title,
+        'execute': execute,
+        'nbconvert_template': template,
+        'gzip_report': gzip_report,
+        'lazy_load_notebooks': lazy_load,
+        'reuse_kernels': reuse_kernels,
+        'minify_notebooks': minify,
+    })
+    fingerprint = _report_fingerprint(report_options, notebook_files)
+    if use_cache:
+        report_path = _up_to_date_report(output_folder, fingerprint)
+        if report_path:
+            print(f"Report is up to date, nothing to do: {report_path}")
+            return
 
     if execute:
         print("Executing and converting notebooks to HTML...")
@@ -1146,42 +2243,79 @@ def generate_report(config_path: str) -> None:
 
     # Check if notebook_files is a dict (nested structure), string (single notebook), or list (flat structure)
     if isinstance(notebook_files, dict):
-        # Nested structure
+        # Nested structure - all topics share one pool so their notebooks convert together
         html_files_dict = {}
-
-        for topic_name, topic_notebooks in notebook_files.items():
-            print(f"Processing topic: {topic_name}")
-            # Get custom names for this topic if provided
-            topic_custom_names = None
-            if tabs_names and isinstance(tabs_names, dict) and topic_name in tabs_names:
-                topic_config = tabs_names[topic_name]
-                if isinstance(topic_config, dict) and 'notebook_names' in topic_config:
-                    topic_custom_names = topic_config['notebook_names']
-                elif isinstance(topic_config, list):
-                    topic_custom_names = topic_config
-            html_files = convert_notebooks_to_html(topic_notebooks, output_folder, current_datetime, execute, topic_custom_names)
-            html_files_dict[topic_name] = html_files
+        os.makedirs(output_folder, exist_ok=True)
+        notebook_count = sum(len(topic_notebooks) for topic_notebooks in notebook_files.values())
+
+        with _make_executor(notebook_count, template, max_workers) as executor:
+            topic_futures = {}
+            # Shared by all topics, so a notebook listed under several topics is converted once
+            submitted = {}
+            for topic_name, topic_notebooks in notebook_files.items():
+                print(f"Processing topic: {topic_name}")
+                topic_futures[topic_name] = _submit_conversions(
+                    executor, topic_notebooks, output_folder, current_datetime, execute, template,
+                    reuse_kernels, minify, use_cache, submitted
+                )
+
+            for topic_name, futures in topic_futures.items():
+                # Get custom names for this topic if provided
+                topic_custom_names = None
+                if tabs_names and isinstance(tabs_names, dict) and topic_name in tabs_names:
+                    topic_config = tabs_names[topic_name]
+                    if isinstance(topic_config, dict) and 'notebook_names' in topic_config:
+                        topic_custom_names = topic_config['notebook_names']
+                    elif isinstance(topic_config, list):
+                        topic_custom_names = topic_config
+                html_files_dict[topic_name] = _collect_conversions(futures, topic_custom_names)
 
         print("Generating nested tabs HTML report...")
-        generate_final_report(html_files_dict, report_title, output_folder, current_datetime, tabs_names)
+        report_path = generate_final_report(
+            html_files_dict, report_title, output_folder, current_datetime, tabs_names, gzip_report, lazy_load
+        )
+        html_files = [
+            html_file_info
+            for topic_html_files in html_files_dict.values()
+            for html_file_info in topic_html_files
+        ]
 
     elif isinstance(notebook_files, str):
         # Single notebook - tabs_names has no effect
         print(f"Processing single notebook: {notebook_files}")
-        html_files = convert_notebooks_to_html([notebook_files], output_folder, current_datetime, execute)
-        if html_files:
-            print("Generating single notebook HTML report...")
-            generate_final_report(html_files[0], report_title, output_folder, current_datetime)
+        notebook_count = 1
+        html_files = convert_notebooks_to_html(
+            [notebook_files], output_folder, current_datetime, execute,
+            template=template, max_workers=max_workers, minify=minify, use_cache=use_cache
+        )
+        if not html_files:
+            print("Done!")
+            return
+        print("Generating single notebook HTML report...")
+        report_path = generate_final_report(
+            html_files[0], report_title, output_folder, current_datetime, gzip_report=gzip_report
+        )
 
     else:
         # Flat structure - tabs_names should be a list matching notebook files by index
         custom_names = None
         if tabs_names and isinstance(tabs_names, list):
             custom_names = tabs_names
-        html_files = convert_notebooks_to_html(notebook_files, output_folder, current_datetime, execute, custom_names)
+        notebook_count = len(notebook_files)
+        html_files = convert_notebooks_to_html(
+            notebook_files, output_folder, current_datetime, execute, custom_names, template, max_workers,
+            reuse_kernels, minify, use_cache
+        )
         print("Generating flat tabs HTML report...")
-        generate_final_report(html_files, report_title, output_folder, current_datetime)
+        report_path = generate_final_report(
+            html_files, report_title, output_folder, current_datetime,
+            gzip_report=gzip_report, lazy_load=lazy_load
+        )
 
+    # A report with notebooks that failed to convert or execute isn't recorded, so they are
+    # retried next time. Failed conversions are missing from html_files, hence the count.
+    if len(html_files) == notebook_count and all(html_file_info['complete'] for html_file_info in html_files):
+        _write_manifest(output_folder, fingerprint, report_path)
     print("Done!")
 
 